@@ -8,4 +8,12 @@ A Simulation class is intended to take multiple Transactions,
 queue them appropriately, and fire them all in order.
 """
 
-__all__ = ["index", "error", "nprand", "simulator", "transaction", "array_utilities"]
+__all__ = [
+    "array_utilities",
+    "bank",
+    "error",
+    "index",
+    "nprand",
+    "simulator",
+    "transaction",
+]
@@ -1,16 +1,16 @@
 """Holds Numpy or PyArrow array utilities."""
 
-import numpy as np
-from numpy.lib.stride_tricks import as_strided
+from typing import Tuple
 
 
 def is_broadcastable(
-    target_array_shape: np.ndarray, broadcast_array_shape: np.ndarray
+    target_array_shape: Tuple[int, ...], broadcast_array_shape: Tuple[int, ...]
 ) -> bool:
     """Test if an array is broadcastable to another.
 
     This function just tests the shape of an array against the shape
-    of another array to determine if it *is* broadcastable.
+    of another array to determine if it *is* broadcastable. It only
+    compares the shapes, so no arrays are built to find out.
 
     https://stackoverflow.com/questions/24743753/test-if-an-array-is-broadcastable-to-a-shape/24765997#24765997
 
@@ -38,13 +38,9 @@ def is_broadcastable(
     >>> is_broadcastable((1000, 1000, 1000), (3,))
     False
     """
-    x = np.array([1])
-    a = as_strided(x=x, shape=target_array_shape, strides=[0] * len(target_array_shape))
-    b = as_strided(
-        x=x, shape=broadcast_array_shape, strides=[0] * len(broadcast_array_shape)
-    )
-    try:
-        _ = np.broadcast_arrays(a, b)
-        return True
-    except ValueError:
-        return False
+    # Shapes are aligned from the trailing axis; missing leading axes
+    #   act as 1. Each aligned pair must match or contain a 1.
+    for x, y in zip(reversed(target_array_shape), reversed(broadcast_array_shape)):
+        if x != y and x != 1 and y != 1:
+            return False
+    return True
@@ -0,0 +1,325 @@
+"""Holds a struct-of-arrays store for many transactions.
+
+A `Transaction` is one Python object per transaction, each carrying its
+own presence array. A `TransactionBank` instead keeps every transaction
+of a simulation in parallel NumPy arrays and builds all of their
+presences in a few vectorized passes, so the cost of a wide portfolio
+is paid in NumPy rather than in the interpreter.
+
+Presences are stored CSR style: the presences of transaction `k` are
+`presence_idx[presence_indptr[k]:presence_indptr[k + 1]]`. For discrete
+transactions these are timesteps and apply to every parallel
+simulation. For probabilistic instantaneous transactions they are the
+parallel simulations which fire at `t0`.
+"""
+
+import numpy as np
+from numpy.random import default_rng
+from cashflow import types as cftypes
+from cashflow.simulate import error as cfserror, transaction as cfst
+from typing import Iterable, List, Optional, Sequence
+
+__all__ = ["TransactionBank"]
+
+
+class TransactionBank:
+    """Stores many transactions as parallel arrays."""
+
+    def __init__(
+        self,
+        simulation_length: int,
+        simulation_width: int,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Build an empty transaction bank.
+
+        Parameters
+        ----------
+        simulation_length: int
+            A number of timesteps to run for.
+        simulation_width: int
+            How many parallel simulations to account for.
+        seed: Optional[int] = None
+            The seed for every random draw the bank makes.
+        """
+        self._n = simulation_length
+        self._m = simulation_width
+        self._seed = seed
+        # Per-field lists collect transactions until finalize.
+        self._t0: List[int] = []
+        self._freq: List[float] = []
+        self._ttype: List[int] = []
+        self._names: List[Optional[str]] = []
+        # These are populated by finalize.
+        self.t0: Optional[np.ndarray] = None
+        self.freq: Optional[np.ndarray] = None
+        self.ttype_code: Optional[np.ndarray] = None
+        self.names: Optional[np.ndarray] = None
+        self.presence_indptr: Optional[np.ndarray] = None
+        self.presence_idx: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        """Return the number of transactions added."""
+        return len(self._t0)
+
+    def add(
+        self,
+        transaction_time: int = 0,
+        frequency: Optional[cftypes.frequency] = None,
+        name: Optional[str] = None,
+    ) -> int:
+        """Add a transaction to the bank.
+
+        Parameters
+        ----------
+        transaction_time: int = 0
+            The timestep at which the transaction first fires.
+        frequency: Optional[cftypes.frequency] = None
+            The frequency of the transaction. See `cashflow.types`.
+        name: Optional[str] = None
+            The name of the transaction. Unnamed transactions are given
+            a random name by `finalize`.
+
+        Returns
+        -------
+        position: int
+            The position of the transaction within the bank's arrays.
+        """
+        ttype = cfst._get_transaction_type(frequency)
+        if ttype not in _SUPPORTED_TYPES:
+            raise NotImplementedError(f"{ttype.name} transactions are not supported.")
+        # Only periodic transactions have integer frequencies.
+        if isinstance(frequency, (int, np.integer)) and frequency <= 0:
+            raise _get_period_error()
+        self._t0.append(cfst._get_timestep(transaction_time))
+        # A one time event behaves like a period as long as the simulation.
+        self._freq.append(self._n if frequency is None else frequency)
+        self._ttype.append(ttype)
+        self._names.append(name)
+        return len(self._t0) - 1
+
+    def extend(
+        self,
+        transaction_times: Sequence[int],
+        frequencies: Sequence[cftypes.frequency],
+        names: Optional[Iterable[Optional[str]]] = None,
+    ) -> np.ndarray:
+        """Add many transactions to the bank at once.
+
+        A NumPy array of frequencies is classified with a single dtype
+        check; any other sequence is added an item at a time.
+
+        Parameters
+        ----------
+        transaction_times: Sequence[int]
+            The timestep at which each transaction first fires.
+        frequencies: Sequence[cftypes.frequency]
+            The frequency of each transaction. An int array holds
+            periods and a float array holds probabilities.
+        names: Optional[Iterable[Optional[str]]] = None
+            The name of each transaction. Missing names are drawn by
+            `finalize`.
+
+        Returns
+        -------
+        positions: np.ndarray
+            The position of each transaction within the bank's arrays.
+
+        Examples
+        --------
+        >>> bank = TransactionBank(simulation_length=10, simulation_width=5)
+        >>> bank.extend([0, 1, 2], np.array([3, 4, 5]))
+        array([0, 1, 2])
+        >>> bank.finalize().presence(2)
+        array([2, 7], dtype=int32)
+        """
+        if len(transaction_times) != len(frequencies):
+            raise ValueError("Every transaction needs a time and a frequency.")
+        names = [None] * len(frequencies) if names is None else list(names)
+        if len(names) != len(frequencies):
+            raise ValueError("Every transaction needs a name or None.")
+        start = len(self)
+        if not isinstance(frequencies, np.ndarray):
+            # Items are checked on a scratch bank, so a bad one part way
+            #   through leaves this bank untouched.
+            scratch = TransactionBank(self._n, self._m)
+            for args in zip(transaction_times, frequencies, names):
+                scratch.add(*args)
+            self._t0.extend(scratch._t0)
+            self._freq.extend(scratch._freq)
+            self._ttype.extend(scratch._ttype)
+            self._names.extend(scratch._names)
+            return np.arange(start, len(self))
+        ttype = _ARRAY_TRANSACTION_TYPES.get(frequencies.dtype.kind)
+        if ttype is None or frequencies.ndim != 1:
+            raise TypeError(f"{frequencies.dtype} is not a valid frequency dtype.")
+        if ttype == cftypes.TransactionType.d_p and np.any(frequencies <= 0):
+            raise _get_period_error()
+        # Times are checked once as an array, as add checks each one.
+        times = np.asarray(transaction_times)
+        if times.ndim != 1 or (times.size and times.dtype.kind not in "iu"):
+            raise TypeError(f"{times.dtype} is not a valid transaction time dtype.")
+        self._t0.extend(times.tolist())
+        self._freq.extend(frequencies.tolist())
+        self._ttype.extend([ttype] * frequencies.size)
+        self._names.extend(names)
+        return np.arange(start, len(self))
+
+    def finalize(self) -> "TransactionBank":
+        """Convert the added transactions to arrays and build presences.
+
+        Returns
+        -------
+        bank: TransactionBank
+            This bank, for chaining.
+
+        Examples
+        --------
+        >>> bank = TransactionBank(simulation_length=10, simulation_width=5)
+        >>> _ = bank.add(transaction_time=2)
+        >>> _ = bank.add(transaction_time=1, frequency=4)
+        >>> bank = bank.finalize()
+        >>> bank.presence_indptr
+        array([0, 1, 4])
+        >>> bank.presence_idx
+        array([2, 1, 5, 9], dtype=int32)
+        """
+        rng = default_rng(self._seed)
+        self.t0 = np.array(self._t0, dtype=np.int32)
+        self.freq = np.array(self._freq, dtype=np.float64)
+        self.ttype_code = np.array(self._ttype, dtype=np.int8)
+        counts = np.zeros(len(self), dtype=np.int64)
+        # Discrete transactions: every presence is t0 + step * period.
+        discrete = np.flatnonzero(self.ttype_code != cftypes.TransactionType.p_i)
+        d_t0 = self.t0[discrete].astype(np.int64)
+        d_period = self.freq[discrete].astype(np.int64)
+        counts[discrete] = _get_periodic_counts(d_t0, d_period, self._n)
+        # Probabilistic transactions: one draw covers all of them.
+        probabilistic = np.flatnonzero(self.ttype_code == cftypes.TransactionType.p_i)
+        p_t0 = self.t0[probabilistic]
+        fired = (
+            rng.random((probabilistic.size, self._m)) < self.freq[probabilistic, None]
+        )
+        # An event scheduled outside the simulation never fires.
+        fired &= ((p_t0 >= 0) & (p_t0 < self._n))[:, None]
+        counts[probabilistic] = fired.sum(axis=1)
+        # Lay every transaction's presences out contiguously, in order.
+        self.presence_indptr = np.concatenate([[0], np.cumsum(counts)])
+        self.presence_idx = np.empty(self.presence_indptr[-1], dtype=np.int32)
+        d_counts = counts[discrete]
+        d_steps = _get_ragged_steps(d_counts)
+        d_positions = np.repeat(self.presence_indptr[discrete], d_counts) + d_steps
+        d_times = np.repeat(d_t0, d_counts) + d_steps * np.repeat(d_period, d_counts)
+        self.presence_idx[d_positions] = d_times
+        p_counts = counts[probabilistic]
+        p_steps = _get_ragged_steps(p_counts)
+        p_positions = np.repeat(self.presence_indptr[probabilistic], p_counts) + p_steps
+        # nonzero walks row-major, so hits are grouped by transaction.
+        self.presence_idx[p_positions] = np.nonzero(fired)[1]
+        self.names = self._get_names(rng)
+        return self
+
+    def presence(self, position: int) -> np.ndarray:
+        """Return the presences of one transaction.
+
+        Parameters
+        ----------
+        position: int
+            The position returned by `add`.
+
+        Returns
+        -------
+        presences: np.ndarray
+        """
+        if self.presence_indptr is None or self.presence_idx is None:
+            raise RuntimeError("Call finalize before reading presences.")
+        start, stop = self.presence_indptr[position : position + 2]
+        return self.presence_idx[start:stop]
+
+    def _get_names(self, rng: np.random.Generator) -> np.ndarray:
+        """Return every name, drawing random ones for unnamed transactions."""
+        names = np.array([name or "" for name in self._names], dtype=object)
+        unnamed = np.flatnonzero([name is None for name in self._names])
+        seeds = rng.integers(_NAME_SEED_HIGH, size=unnamed.size, dtype=np.int64)
+        names[unnamed] = cfst._get_random_names(seeds)
+        return names
+
+
+# Exclusive upper bound on the seeds drawn for random names. The full
+#   int64 range keeps names from colliding in large banks.
+_NAME_SEED_HIGH = np.iinfo(np.int64).max
+
+# Transaction types the bank can build presences for.
+_SUPPORTED_TYPES = {
+    cftypes.TransactionType.d_i,
+    cftypes.TransactionType.d_p,
+    cftypes.TransactionType.p_i,
+}
+
+# An array with one frequency per transaction, classified by dtype kind.
+_ARRAY_TRANSACTION_TYPES = {
+    "i": cftypes.TransactionType.d_p,
+    "u": cftypes.TransactionType.d_p,
+    "f": cftypes.TransactionType.p_i,
+}
+
+
+def _get_period_error() -> cfserror.InputConfigurationError:
+    """Return the error raised for a period that never advances."""
+    return cfserror.InputConfigurationError("""
+    \n[Periodic Transaction Frequency]: Periods must be positive integers.
+    """)
+
+
+def _get_periodic_counts(
+    t0: np.ndarray, period: np.ndarray, simulation_length: int
+) -> np.ndarray:
+    """Return how many times each periodic transaction fires.
+
+    Parameters
+    ----------
+    t0: np.ndarray
+        The first timestep of each transaction.
+    period: np.ndarray
+        The period of each transaction.
+    simulation_length: int
+        The number of timesteps in the simulation.
+
+    Returns
+    -------
+    counts: np.ndarray
+        The number of timesteps in [t0, simulation_length) that are a
+        whole number of periods after t0.
+
+    Examples
+    --------
+    >>> _get_periodic_counts(np.array([0, 3, 7, -1]), np.array([4, 1, 2, 1]), 6)
+    array([2, 3, 0, 0])
+    """
+    remaining = np.maximum(simulation_length - t0, 0)
+    # Ceiling division without leaving integers.
+    return np.where(t0 >= 0, -(-remaining // period), 0)
+
+
+def _get_ragged_steps(counts: np.ndarray) -> np.ndarray:
+    """Return each item's position within its own row of a ragged array.
+
+    This is a ragged `np.arange`: row `k` contributes `0, 1, ...,
+    counts[k] - 1`, all rows concatenated, without a Python loop.
+
+    Parameters
+    ----------
+    counts: np.ndarray
+        The length of each row.
+
+    Returns
+    -------
+    steps: np.ndarray
+
+    Examples
+    --------
+    >>> _get_ragged_steps(np.array([2, 0, 3]))
+    array([0, 1, 0, 1, 2])
+    """
+    starts = np.cumsum(counts) - counts
+    return np.arange(counts.sum()) - np.repeat(starts, counts)
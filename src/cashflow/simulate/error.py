@@ -1,8 +1,11 @@
 """This provides a base class for errors."""
 
 
-class InputConfigurationError(BaseException):
+class InputConfigurationError(Exception):
+    """Raised when a simulation input is configured incorrectly."""
+
+    # Built once; every message is prefixed with this banner.
+    _HEADER = "*" * 79 + "\n[Input Configuration Error]:\n\n"
+
     def __init__(self, message: str):
-        msg_header = "*" * 79
-        msg_header += "\n[Input Configuration Error]:\n\n"
-        super().__init__(message)
+        super().__init__(self._HEADER + message)
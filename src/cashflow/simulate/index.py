@@ -2,7 +2,197 @@
 import numpy as np
 from cashflow import types as cftypes
 from cashflow.simulate import error as cfserror, array_utilities as cfsau
-from typing import Optional, Type
+from typing import Optional, Union
+
+# Probabilities at or below this are sampled sparsely instead of
+#   drawing and masking a full (simulation_length, simulation_width)
+#   array of uniforms.
+_SPARSE_PROBABILITY_CUTOFF = 0.2
+
+# Dense draws are made about this many cells at a time.
+_DENSE_BLOCK_CELLS = 2**16
+
+
+def _get_index_dtype(n_cells: int) -> type:
+    """Returns the narrowest index dtype able to address every cell.
+
+    Halving the index width halves the memory moved by everything
+    downstream that sorts, gathers, or masks with the indices.
+
+    Parameters
+    ----------
+    n_cells: int
+        The number of cells, simulation_length * simulation_width.
+
+    Returns
+    -------
+    dtype: type
+        np.int32 when every flat position fits, otherwise np.int64.
+
+    Examples
+    --------
+    >>> _get_index_dtype(100)
+    <class 'numpy.int32'>
+    >>> _get_index_dtype(2**31 + 1)
+    <class 'numpy.int64'>
+    """
+    return np.int32 if n_cells <= np.iinfo(np.int32).max else np.int64
+
+
+def _get_indices_sparse(
+    simulation_length: int,
+    simulation_width: int,
+    prob: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Returns indices for a uniform probability without a dense mask.
+
+    Every cell of the simulation fires independently with probability
+    `prob`, so the gap from one firing cell to the next is geometric.
+    This draws the gaps and accumulates them into flat positions, which
+    arrive already sorted. Memory and random draws scale with the
+    number of hits rather than with the size of the simulation.
+
+    Parameters
+    ----------
+    simulation_length: int
+        The number of timesteps in the simulation.
+    simulation_width: int
+        The number of parallel simulations.
+    prob: float
+        The probability that any single cell fires.
+    rng: np.random.Generator
+        The random number generator used for the draws.
+
+    Returns
+    -------
+    sorted_indices: np.ndarray
+        A (k, 2) array of [timestep, simulation] indices in row-major
+        order, identical in layout to `np.argwhere`. The dtype is the
+        narrowest from `_get_index_dtype`.
+
+    Examples
+    --------
+    >>> from numpy.random import default_rng
+    >>> _get_indices_sparse(
+    ...     simulation_length=4,
+    ...     simulation_width=3,
+    ...     prob=.25,
+    ...     rng=default_rng(0)
+    ... ).shape[1]
+    2
+    """
+    n_cells = simulation_length * simulation_width
+    # A NaN probability never fires, just as it never passes the dense mask.
+    if not prob > 0 or n_cells == 0:
+        flat = np.empty(0, dtype=np.int64)
+    else:
+        # Enough gaps to pass the end of the simulation almost always.
+        expected = n_cells * prob
+        batch = int(expected + 4 * np.sqrt(expected) + 16)
+        # A gap of g means the next hit is g cells on; the first is at g - 1.
+        #   Any gap of more than n_cells lands past the end, so capping it
+        #   there keeps tiny probabilities from overflowing the running sum.
+        gaps = np.minimum(rng.geometric(prob, size=batch), n_cells + 1)
+        flat = np.cumsum(gaps) - 1
+        while flat[-1] < n_cells:
+            gaps = np.minimum(rng.geometric(prob, size=batch), n_cells + 1)
+            flat = np.concatenate([flat, flat[-1] + np.cumsum(gaps)])
+        # Positions are increasing, so the hits are everything before the end.
+        flat = flat[: np.searchsorted(flat, n_cells)]
+    flat = flat.astype(_get_index_dtype(n_cells), copy=False)
+    return np.stack(np.divmod(flat, simulation_width), axis=1)
+
+
+def _get_indices_dense(
+    simulation_length: int,
+    simulation_width: int,
+    prob: Union[float, np.ndarray],
+    rng: np.random.Generator,
+    rand_buf: Optional[np.ndarray] = None,
+    mask_buf: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Returns indices for a probability by masking a full draw.
+
+    One uniform is drawn for every cell of the simulation and compared
+    against `prob`, which may be a single float or any array that is
+    broadcastable to (simulation_length, simulation_width).
+
+    The draw is made a block of timesteps at a time so that only the
+    indices that fire are ever held for the whole simulation; the
+    float and bool temporaries stay the size of one block. The random
+    stream is identical to drawing everything at once.
+
+    Callers drawing repeatedly may pass scratch buffers; the draw and
+    the comparison are then written in place instead of allocating a
+    fresh float and bool array on every call.
+
+    Parameters
+    ----------
+    simulation_length: int
+        The number of timesteps in the simulation.
+    simulation_width: int
+        The number of parallel simulations.
+    prob: Union[float, np.ndarray]
+        The probability that a cell fires.
+    rng: np.random.Generator
+        The random number generator used for the draws.
+    rand_buf: Optional[np.ndarray] = None
+        A C-contiguous float64 scratch array of shape (block_rows,
+        simulation_width) to draw the uniforms into. Its row count sets
+        the block size.
+    mask_buf: Optional[np.ndarray] = None
+        A bool scratch array of the same shape to write the mask into.
+
+    Returns
+    -------
+    sorted_indices: np.ndarray
+        A (k, 2) array of [timestep, simulation] indices in row-major
+        order, identical in layout to `np.argwhere`. The dtype is the
+        narrowest from `_get_index_dtype`.
+
+    Examples
+    --------
+    >>> from numpy.random import default_rng
+    >>> _get_indices_dense(
+    ...     simulation_length=2,
+    ...     simulation_width=3,
+    ...     prob=1.,
+    ...     rng=default_rng(0)
+    ... )
+    array([[0, 0],
+           [0, 1],
+           [0, 2],
+           [1, 0],
+           [1, 1],
+           [1, 2]], dtype=int32)
+    """
+    # A view, so slicing a block of probabilities never copies.
+    prob = np.broadcast_to(prob, (simulation_length, simulation_width))
+    if rand_buf is not None:
+        block_rows = rand_buf.shape[0]
+    elif mask_buf is not None:
+        block_rows = mask_buf.shape[0]
+    else:
+        block_rows = max(1, _DENSE_BLOCK_CELLS // max(1, simulation_width))
+    block_rows = max(1, min(block_rows, simulation_length))
+    if rand_buf is None:
+        rand_buf = np.empty((block_rows, simulation_width))
+    if mask_buf is None:
+        mask_buf = np.empty((block_rows, simulation_width), dtype=bool)
+    flat_blocks = [np.empty(0, dtype=np.intp)]
+    for start in range(0, simulation_length, block_rows):
+        stop = min(start + block_rows, simulation_length)
+        rand = rand_buf[: stop - start]
+        mask = mask_buf[: stop - start]
+        rng.random(out=rand)
+        np.less(rand, prob[start:stop], out=mask)
+        # flatnonzero on the flat mask skips argwhere's 2D index construction.
+        flat_blocks.append(np.flatnonzero(mask) + start * simulation_width)
+    flat: np.ndarray = np.concatenate(flat_blocks).astype(
+        _get_index_dtype(simulation_length * simulation_width), copy=False
+    )
+    return np.stack(np.divmod(flat, simulation_width), axis=1)
 
 
 def _get_indices_periodic(
@@ -10,12 +200,20 @@ def _get_indices_periodic(
     simulation_length: int,
     simulation_width: int,
     freq: cftypes.frequency,
-    rng: Optional[Type[np.random.default_rng]] = None,
+    rng: Optional[np.random.Generator] = None,
+    rand_buf: Optional[np.ndarray] = None,
+    mask_buf: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Returns periodic indices.
 
     Parameters
     ----------
+    rand_buf: Optional[np.ndarray] = None
+        Scratch space for the dense probabilistic draw. See
+        `_get_indices_dense`.
+    mask_buf: Optional[np.ndarray] = None
+        Scratch space for the dense probabilistic mask. See
+        `_get_indices_dense`.
 
     Returns
     -------
@@ -35,12 +233,12 @@ def _get_indices_periodic(
     ...     simulation_width=5,
     ...     freq=2
     ... )
-    array([0, 2, 4])
+    array([0, 2, 4], dtype=int32)
 
     This is another simple example. If it's a float frequency it
     represents a *uniform random probability*. It needs an RNG object
     passed into it. This example gives all items a uniform probability
-    of 0.3. A 5x5 simulation with a .3 probability will yield ~8 indices.
+    of 0.3. A 5x5 simulation with a .3 probability will yield ~8 indices on average.
 
     >>> from numpy.random import default_rng
     >>> rng = default_rng(3)
@@ -52,7 +250,7 @@ def _get_indices_periodic(
     ...     rng=rng
     ... ).T
     array([[0, 0, 0, 1, 1, 3, 3, 4, 4],
-           [0, 1, 4, 2, 4, 1, 4, 0, 2]])
+           [0, 1, 4, 2, 4, 1, 4, 0, 2]], dtype=int32)
 
     These few examples use broadcasting to take an array of
     probabilities instead of a single probability. In the first case
@@ -68,7 +266,7 @@ def _get_indices_periodic(
     ...     rng=rng
     ... ).T
     array([[0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 4],
-           [0, 1, 3, 0, 1, 0, 1, 0, 1, 0, 2]])
+           [0, 1, 3, 0, 1, 0, 1, 0, 1, 0, 2]], dtype=int32)
 
     In this second case the probabilities can be interpreted as a
     single float to use *in each time step*. Note that almost all
@@ -81,7 +279,7 @@ def _get_indices_periodic(
     ...     rng=rng
     ... ).T
     array([[0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 2],
-           [0, 1, 2, 3, 4, 0, 1, 2, 3, 4, 0]])
+           [0, 1, 2, 3, 4, 0, 1, 2, 3, 4, 0]], dtype=int32)
 
     In this third contrived and silly example the probabilities are
     *unique* to every independent timestep acrosss all simulations.
@@ -99,13 +297,20 @@ def _get_indices_periodic(
     ...     rng=rng
     ... ).T
     array([[0, 1, 1],
-           [3, 0, 2]])
+           [3, 0, 2]], dtype=int32)
     """
-    if isinstance(freq, int):
+    if isinstance(freq, (int, np.integer)):
         # This is a dsicrete *period*.
         # This will be broadcast
-        sorted_periodic_indices = range(start_index, simulation_length, freq)
-    elif isinstance(freq, float):
+        # Timesteps are bounded by the simulation length, so they
+        #   usually fit the narrower index dtype.
+        sorted_periodic_indices: np.ndarray = np.arange(
+            start_index,
+            simulation_length,
+            freq,
+            dtype=_get_index_dtype(simulation_length),
+        )
+    elif isinstance(freq, (float, np.floating)):
         # This is a *single* float and represents a probability for
         #   all timesteps.
         if rng is None:
@@ -114,10 +319,26 @@ def _get_indices_periodic(
             \n[Probabilistic Transaction Frequency]: No rng object available.
             """
             )
-        sorted_periodic_indices = np.argwhere(
-            rng.random((simulation_length, simulation_width)) <= freq
-        )
-    elif isinstance(freq, np.ndarray) and np.issubdtype(freq.dtype, np.floating):
+        # NumPy float scalars are drawn against as plain floats.
+        prob = float(freq)
+        if prob > _SPARSE_PROBABILITY_CUTOFF:
+            # Dense enough that drawing the full mask is cheaper.
+            sorted_periodic_indices = _get_indices_dense(
+                simulation_length=simulation_length,
+                simulation_width=simulation_width,
+                prob=prob,
+                rng=rng,
+                rand_buf=rand_buf,
+                mask_buf=mask_buf,
+            )
+        else:
+            sorted_periodic_indices = _get_indices_sparse(
+                simulation_length=simulation_length,
+                simulation_width=simulation_width,
+                prob=prob,
+                rng=rng,
+            )
+    elif isinstance(freq, np.ndarray) and freq.dtype.kind == "f":
         if not cfsau.is_broadcastable(
             freq.shape, (simulation_length, simulation_width)
         ):
@@ -126,9 +347,22 @@ def _get_indices_periodic(
             \n[Probabilistic Transaction Frequency]: Probability not broadcastable.
             """
             )
-        sorted_periodic_indices = np.argwhere(
-            rng.random((simulation_length, simulation_width)) <= freq
+        if rng is None:
+            raise cfserror.InputConfigurationError(
+                """
+            \n[Probabilistic Transaction Frequency]: No rng object available.
+            """
+            )
+        sorted_periodic_indices = _get_indices_dense(
+            simulation_length=simulation_length,
+            simulation_width=simulation_width,
+            prob=freq,
+            rng=rng,
+            rand_buf=rand_buf,
+            mask_buf=mask_buf,
         )
     else:
         raise cfserror.InputConfigurationError("Shitass!")
-    return np.array(sorted_periodic_indices)
+    # Every branch already builds an array of the `_get_index_dtype`
+    #   width, so no copy is needed.
+    return sorted_periodic_indices
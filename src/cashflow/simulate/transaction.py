@@ -13,23 +13,54 @@ This class does two things:
 """
 import hashlib
 import numpy as np
+import operator
+import os
+import random
+from functools import lru_cache
 from numpy.random import default_rng
 from cashflow import types as cftypes
-from cashflow.simulate import index as cfsi
-from typing import Iterable, Optional
+from cashflow.simulate import error as cfserror, index as cfsi
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
-__all__ = ["Transaction"]
+__all__ = ["Transaction", "build_batch"]
+
+# Draws the entropy for transactions built without a seed.
+_ENTROPY_RNG = random.Random()
+# A forked worker would otherwise continue its parent's stream, so every
+#   worker would build the same "unseeded" transactions.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_ENTROPY_RNG.seed)
+
+# Replicate streams extend the spawn key with this first, so they can
+#   never coincide with the children `build_batch` spawns from a seed.
+_REPLICATE_DOMAIN = 0x5245504C
+
+# Names copy this initialized hash state rather than setting a new one up.
+_NAME_HASH = hashlib.blake2b(digest_size=16)
 
 
 class Transaction:
     """Do nothing."""
 
+    # Fixed attributes keep instances small when building many of them.
+    __slots__ = (
+        "_n",
+        "_m",
+        "t_0",
+        "_seed",
+        "_rng",
+        "_f",
+        "_transaction_type",
+        "_name_value",
+        "_presence",
+    )
+
     def __init__(
         self,
         simulation_length: int,
         simulation_width: int,
         transaction_time: int = 0,
-        seed: Optional[int] = None,
+        seed: Optional[Union[int, np.random.SeedSequence]] = None,
         frequency: Optional[cftypes.frequency] = None,
         name: Optional[str] = None,
     ) -> None:
@@ -48,37 +79,240 @@ class Transaction:
             {'second', 'minute', 'hour', 'day', 'month', 'year'}
         simulation_start_time: cftypes.time = None
             This is a timestamp denoting when the simulation starts.
-        transaction_time: cftypes.time = None
-            This is a timestamp denoting when the transaction fires
-            for the first time.
+        transaction_time: int = 0
+            The timestep at which the transaction fires for the first
+            time. Any integer, including NumPy integers, is accepted and
+            stored as a plain int.
+        seed: Optional[Union[int, np.random.SeedSequence]] = None
+            The seed for this transaction's random number generator.
+            A SeedSequence spawned from a shared root may be passed
+            directly; see `build_batch`. Without a seed, entropy is
+            drawn once here so that replicates stay reproducible.
         """
         # The field of transactions we're going to consider is n x m
         # There are n timesteps.
         self._n = simulation_length
         # There are m parallel simulations.
         self._m = simulation_width
-        # Set the initial transaction time.
-        self.t_0 = transaction_time
-        # This has prescribed randomness (or not)
+        # Set the initial transaction time, normalized once to a timestep.
+        self.t_0 = _get_timestep(transaction_time)
+        # This has prescribed randomness (or not), but the generator is
+        #   only built once something actually draws from it. Unseeded
+        #   entropy comes from one shared generator rather than the OS.
+        if seed is None:
+            seed = _ENTROPY_RNG.getrandbits(128)
         self._seed = seed
-        self._rng = default_rng(seed)
+        self._rng: Optional[np.random.Generator] = None
         # This has a frequency
         self._f = frequency
         # which can be used to quickly place this transaction into a bucket.
-        self._transaction_type: str = _get_transaction_type(frequency)
+        self._transaction_type = _get_transaction_type(frequency)
         # This needs to scrape input still to build probabilistic draw?
         # Finally, this transaction has a name. It *could* be a custom name.
-        if name is None:
-            # But if it's not we'll just give it a *pretty random* name.
-            name = _get_random_name(self._rng.integers(low=0, high=int(1e6)))
-        self._name = name
-        # Declare where this transaction will fire.
-        self._presence = _get_indices(
+        #   If it's not, a *pretty random* one is made on first access.
+        self._name_value = name
+        # Declare where this transaction will fire. Probabilistic presences
+        #   are drawn on demand by `presence` rather than at construction.
+        self._presence: Optional[np.ndarray] = None
+        if self._transaction_type not in _DEFERRED_TYPES:
+            self._presence = _get_indices(
+                transaction=self,
+            )
+
+    @classmethod
+    def from_seed_sequence(
+        cls, seed_sequence: np.random.SeedSequence, **kwargs: Any
+    ) -> "Transaction":
+        """Build a transaction seeded from a pre-spawned SeedSequence.
+
+        Parameters
+        ----------
+        seed_sequence: np.random.SeedSequence
+            The seed sequence for this transaction, typically one child
+            of `SeedSequence.spawn`.
+        **kwargs: Any
+            Every other `Transaction` keyword argument.
+
+        Returns
+        -------
+        transaction: Transaction
+        """
+        return cls(seed=seed_sequence, **kwargs)
+
+    def presence(self, replicate_seed: Optional[int] = None) -> np.ndarray:
+        """Return the indices at which this transaction fires.
+
+        Discrete presences are built at construction and always returned
+        as is. Probabilistic presences are drawn on the first call from
+        the transaction's own generator and cached; passing a
+        `replicate_seed` instead draws a fresh, uncached presence from a
+        generator specific to that replicate, so one transaction can be
+        reused across many Monte Carlo replicates.
+
+        Parameters
+        ----------
+        replicate_seed: Optional[int] = None
+            The replicate to draw for. The same transaction seed and
+            replicate seed always yield the same draw.
+
+        Returns
+        -------
+        transaction_indices: np.ndarray
+
+        Examples
+        --------
+        >>> lottery = Transaction(
+        ...     simulation_length=10,
+        ...     simulation_width=5,
+        ...     seed=0,
+        ...     name='Lottery',
+        ...     frequency=.5,
+        ... )
+        >>> lottery.presence() is lottery.presence()
+        True
+        >>> bool(np.all(lottery.presence(3) == lottery.presence(3)))
+        True
+        """
+        if replicate_seed is None or self._transaction_type not in _DEFERRED_TYPES:
+            if self._presence is None:
+                self._presence = _get_indices(transaction=self)
+            return self._presence
+        return _get_indices(
             transaction=self,
+            rng=_get_replicate_rng(self._seed, replicate_seed),
         )
 
+    @property
+    def _name(self) -> str:
+        """Return the name, making a random one on first use."""
+        if self._name_value is None:
+            self._name_value = _get_random_name(_get_name_seed(self._seed))
+        return self._name_value
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """Return the random number generator, building it on first use."""
+        if self._rng is None:
+            self._rng = default_rng(self._seed)
+        return self._rng
+
+
+def build_batch(
+    n: int,
+    root_seed: Optional[int] = None,
+    factory: Optional[Callable[..., Transaction]] = None,
+    **kwargs: Any,
+) -> List[Transaction]:
+    """Build a batch of independently seeded transactions.
+
+    A single root SeedSequence is spawned into `n` statistically
+    independent children in one call, rather than hashing `n` separate
+    integer seeds.
+
+    Parameters
+    ----------
+    n: int
+        The number of transactions to build.
+    root_seed: Optional[int] = None
+        The entropy for the root SeedSequence.
+    factory: Optional[Callable[..., Transaction]] = None
+        Called as `factory(child, **kwargs)` for every child sequence.
+        Defaults to `Transaction.from_seed_sequence`.
+    **kwargs: Any
+        Keyword arguments passed to every `factory` call.
+
+    Returns
+    -------
+    transactions: List[Transaction]
+
+    Examples
+    --------
+    >>> batch = build_batch(
+    ...     3,
+    ...     root_seed=0,
+    ...     simulation_length=10,
+    ...     simulation_width=5,
+    ...     frequency=2,
+    ... )
+    >>> len({t._name for t in batch})
+    3
+    """
+    if factory is None:
+        factory = Transaction.from_seed_sequence
+    children = np.random.SeedSequence(root_seed).spawn(n)
+    # Unnamed transactions hash their names lazily, from their own child.
+    return [factory(child, **kwargs) for child in children]
+
+
+# Transaction types for the scalar frequencies, keyed on exact type.
+_SCALAR_TRANSACTION_TYPES = {
+    # I'm only going to happen once!
+    type(None): cftypes.TransactionType.d_i,
+    # I'll happen periodically and reliably.
+    int: cftypes.TransactionType.d_p,
+    # A float occurs probabilistically and instantaneously.
+    float: cftypes.TransactionType.p_i,
+}
+
+
+def _get_name_seed(seed: Union[int, np.random.SeedSequence]) -> int:
+    """Return the seed a transaction's random name is hashed from.
+
+    Parameters
+    ----------
+    seed: Union[int, np.random.SeedSequence]
+        The transaction's seed.
+
+    Returns
+    -------
+    name_seed: int
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        # A spawned sequence already hashes its entropy for us.
+        return int(seed.generate_state(1)[0])
+    # The stdlib generator is far cheaper to seed than a NumPy one.
+    return random.Random(seed).getrandbits(32)
+
+
+def _get_timestep(transaction_time: Any) -> int:
+    """Return a transaction time as an integer timestep.
 
-def _get_transaction_type(frequency: cftypes.frequency) -> str:
+    Parameters
+    ----------
+    transaction_time: Any
+        The time to normalize.
+
+    Returns
+    -------
+    timestep: int
+
+    Examples
+    --------
+    >>> _get_timestep(3)
+    3
+    >>> _get_timestep(np.int64(3))
+    3
+    >>> _get_timestep(3.)
+    Traceback (most recent call last):
+    ...
+    TypeError: 'float' object cannot be interpreted as an integer
+    """
+    # Anything not in the table must at least be usable as an index.
+    to_step = _TIME_TO_STEP.get(type(transaction_time), operator.index)
+    return to_step(transaction_time)
+
+
+# Converters from the accepted time types to a timestep, keyed on exact type.
+_TIME_TO_STEP: Dict[type, Callable[[Any], int]] = {
+    int: int,
+    np.int32: int,
+    np.int64: int,
+}
+
+
+def _get_transaction_type(
+    frequency: cftypes.frequency,
+) -> cftypes.TransactionType:
     """Return type of transaction.
 
     For a full list of transaction types please view:
@@ -102,8 +336,8 @@ def _get_transaction_type(frequency: cftypes.frequency) -> str:
 
     Returns
     -------
-    transaction_type: str
-        The type of the transaction.
+    transaction_type: cftypes.TransactionType
+        The type of the transaction. The member name is the type tag.
 
     Examples
     --------
@@ -111,60 +345,95 @@ def _get_transaction_type(frequency: cftypes.frequency) -> str:
     Ints are directly translated as a *period* and thus are discrete
     and periodic.
     >>> _get_transaction_type(2)
-    'd_p'
+    <TransactionType.d_p: 1>
 
     Floats are directly translated as a *probability* and are thus
     probabilistic and instantaneous.
     >>> _get_transaction_type(2.)
-    'p_i'
+    <TransactionType.p_i: 3>
 
     No frequency? No problem! It's discrete and only happens once.
     >>> _get_transaction_type(None)
-    'd_i'
+    <TransactionType.d_i: 0>
 
     What about lists or arrays of ints?
     >>> import numpy as np
     >>> _get_transaction_type([1, 1, 1])
-    'd_a'
+    <TransactionType.d_a: 2>
     >>> _get_transaction_type(np.array([1, 1, 1]))
-    'd_a'
+    <TransactionType.d_a: 2>
     >>> _get_transaction_type([1., 1., 1.])
-    'p_a'
+    <TransactionType.p_a: 5>
     >>> _get_transaction_type(np.array([1., 1., 1.]))
-    'p_a'
+    <TransactionType.p_a: 5>
     """
     # How do we determine transaction types?
-    if frequency is None:
-        # I'm only going to happen once!
-        ttype = "d_i"
-    elif isinstance(frequency, int):
-        # I'll happen periodically and reliably.
-        ttype = "d_p"
-    elif isinstance(frequency, float):
-        # A float occurs probabilistically and instantaneously.
-        ttype = "p_i"
+    # The common scalar cases are a single lookup on the exact type.
+    ttype = _SCALAR_TRANSACTION_TYPES.get(type(frequency))
+    if ttype is not None:
+        return ttype
+    # Containers are a single lookup to find the handler that inspects them.
+    handler = _CONTAINER_TRANSACTION_TYPES.get(type(frequency))
+    if handler is not None:
+        return handler(frequency)
+    # Anything else is a subclass or an unusual iterable.
+    if isinstance(frequency, (int, np.integer)):
+        # Subclasses of int (bool, IntEnum) and NumPy ints are still periodic.
+        ttype = cftypes.TransactionType.d_p
+    elif isinstance(frequency, (float, np.floating)):
+        # Any float occurs probabilistically and instantaneously.
+        ttype = cftypes.TransactionType.p_i
     elif isinstance(frequency, np.ndarray):
-        if np.issubdtype(frequency.dtype, np.floating):
-            # Floats are probabilistic, an array is aperiodic.
-            ttype = "p_a"
-        elif np.issubdtype(frequency.dtype, np.integer):
-            # Ints are discrete, an array is aperiodic.
-            ttype = "d_a"
-    elif isinstance(frequency, Iterable):
-        if all(map(lambda x: isinstance(x, int), frequency)):
-            # These are going to happen aperiodically.
-            ttype = "d_a"
-        elif all(map(lambda x: isinstance(x, float), frequency)):
-            ttype = "p_a"
+        ttype = _get_array_transaction_type(frequency)
+    elif hasattr(frequency, "__iter__"):
+        # Looking up __iter__ is cheaper than the Iterable ABC check.
+        ttype = _get_iterable_transaction_type(frequency)
     else:
         raise TypeError
     return ttype
 
 
+def _get_array_transaction_type(frequency: np.ndarray) -> cftypes.TransactionType:
+    """Return the type of a transaction with an array frequency."""
+    kind = frequency.dtype.kind
+    if kind == "f":
+        # Floats are probabilistic, an array is aperiodic.
+        return cftypes.TransactionType.p_a
+    if kind in "iu":
+        # Ints are discrete, an array is aperiodic.
+        return cftypes.TransactionType.d_a
+    raise TypeError(f"{frequency.dtype} is not a valid frequency dtype.")
+
+
+def _get_iterable_transaction_type(
+    frequency: Iterable[Union[int, float]],
+) -> cftypes.TransactionType:
+    """Return the type of a transaction with an iterable frequency."""
+    # One pass over the elements, then only the distinct types are checked.
+    element_types = set(map(type, frequency))
+    if all(issubclass(t, int) for t in element_types):
+        # These are going to happen aperiodically.
+        return cftypes.TransactionType.d_a
+    if all(issubclass(t, float) for t in element_types):
+        return cftypes.TransactionType.p_a
+    raise TypeError("Iterable frequencies must be all ints or all floats.")
+
+
+# Handlers for the container frequencies, keyed on exact type.
+_CONTAINER_TRANSACTION_TYPES: Dict[type, Callable[..., cftypes.TransactionType]] = {
+    np.ndarray: _get_array_transaction_type,
+    list: _get_iterable_transaction_type,
+    tuple: _get_iterable_transaction_type,
+}
+
+
+@lru_cache(maxsize=4096)
 def _get_random_name(seed: int) -> str:
     """Generate a pseudo random name.
 
-    This makes a quasi-pRNG 'name'.
+    This makes a quasi-pRNG 'name'. The seed is hashed as its fixed
+    width little-endian bytes with BLAKE2b, which is faster than MD5 on
+    short inputs and skips the int to decimal string round trip.
 
     Parameters
     ----------
@@ -178,16 +447,54 @@ def _get_random_name(seed: int) -> str:
     Examples
     --------
     >>> _get_random_name(0)
-    'cfcd208495d565ef66e7dff9f98764da'
+    'c804ce198ec337e3dc762bdd1a09aece'
     >>> _get_random_name(1)
-    'c4ca4238a0b923820dcc509a6f75849b'
+    '9ea2d098b5f70192f96c06f38d3fbc97'
     >>> _get_random_name(2)
-    'c81e728d9d4c2f636f067f89cc14862c'
+    'fc069c24352798859c017ce862813d3b'
     """
-    return hashlib.md5(str(seed).encode("utf-8")).hexdigest()
+    name_hash = _NAME_HASH.copy()
+    # int() accepts NumPy integer seeds, which have no to_bytes.
+    name_hash.update(int(seed).to_bytes(8, "little", signed=True))
+    return name_hash.hexdigest()
+
+
+def _get_random_names(seeds: Iterable[int]) -> np.ndarray:
+    """Generate pseudo random names for many seeds at once.
+
+    This produces exactly the names `_get_random_name` would, but packs
+    every seed into a single little-endian int64 buffer up front and
+    hashes slices of it, instead of converting each seed on its own.
+
+    Parameters
+    ----------
+    seeds: Iterable[int]
+        The seeds to hash to create names.
 
+    Returns
+    -------
+    pseudo_random_hashes: np.ndarray
+        One 32 character name per seed.
 
-def _get_indices(transaction: Transaction) -> np.ndarray:
+    Examples
+    --------
+    >>> _get_random_names([0, 1, 2])
+    array(['c804ce198ec337e3dc762bdd1a09aece',
+           '9ea2d098b5f70192f96c06f38d3fbc97',
+           'fc069c24352798859c017ce862813d3b'], dtype='<U32')
+    """
+    packed = memoryview(np.asarray(seeds, dtype="<i8").tobytes())
+    names = []
+    for i in range(0, len(packed), 8):
+        name_hash = _NAME_HASH.copy()
+        name_hash.update(packed[i : i + 8])
+        names.append(name_hash.hexdigest())
+    return np.array(names, dtype="U32")
+
+
+def _get_indices(
+    transaction: Transaction, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
     r"""Return expected transaction indices.
 
     This function produces a two dimensional Numpy array of expected
@@ -204,6 +511,14 @@ def _get_indices(transaction: Transaction) -> np.ndarray:
      the period, and the random function.
     * p_a: This is probabilistic and aperiodic: We need to figure that out.
 
+    Parameters
+    ----------
+    transaction: Transaction
+        The transaction to build indices for.
+    rng: Optional[np.random.Generator] = None
+        The generator probabilistic transactions draw from. Defaults to
+        the transaction's own.
+
     Returns
     -------
     transaction_indices: np.ndarray
@@ -232,7 +547,7 @@ def _get_indices(transaction: Transaction) -> np.ndarray:
     ...     frequency=1,
     ... )
     >>> _get_indices(gas_bill)
-    array([2, 3, 4, 5, 6, 7, 8, 9])
+    array([2, 3, 4, 5, 6, 7, 8, 9], dtype=int32)
 
     This example includes a float frequency and thus is probabilistic.
     We're going to draw a random uniform for this timestamp in all
@@ -253,16 +568,17 @@ def _get_indices(transaction: Transaction) -> np.ndarray:
     >>> gas_inds.ndim
     2
 
-    Each one of these indices can be read [i, j] where i \in (1, n) and
-    j \in (1, m).
-    >>> np.amax(gas_inds[:, 1])
-    3
-    >>> np.amax(gas_inds[:, 0])
-    9
+    Each one of these indices can be read [i, j] where i is the
+    transaction's timestep and j is a parallel simulation it fired in.
+    >>> gas_inds
+    array([[2, 0],
+           [2, 1],
+           [2, 2],
+           [2, 3]], dtype=int32)
 
-    How many of the indices were drawn out of the 50 total?
+    How many of the indices were drawn out of the 5 total?
     >>> gas_inds.shape
-    (28, 2)
+    (4, 2)
 
     Now we're going to talk about a one-time event which *might* happen.
     In the fifth timestep you *might* get promoted. Let's call it a 70% chance.
@@ -275,38 +591,127 @@ def _get_indices(transaction: Transaction) -> np.ndarray:
     ...     frequency=.7,
     ... )
     """
-    # What's the transactions basic type?
-    t_type = transaction._transaction_type
-    if t_type == "d_i":
-        # If instantaneous and discrete it's pretty easy!
-        transaction_indices = transaction.t_0
-    elif t_type == "d_p":
-        # If it's periodic and discrete it's still pretty easy.
-        transaction_indices = cfsi._get_indices_periodic(
-            start_index=transaction.t_0,
-            simulation_length=transaction._n,
-            simulation_width=transaction._m,
-            freq=transaction._f,
-        )
-    elif t_type == "d_a":
-        raise NotImplementedError
-    elif t_type == "p_i":
-        # If instantaneous and probabilistic it's pretty easy!
-        _rand = transaction._rng.random(transaction._m).reshape(1, -1)
-        transaction_indices = np.stack(
-            [np.arange(transaction._n), np.argwhere(_rand < transaction._f)], axis=1
-        )
-    elif t_type == "p_p":
-        # If it's periodic and probabilistic is's still pretty easy.
-        transaction_indices = cfsi._get_indices_periodic(
-            start_index=transaction.t_0,
-            simulation_length=transaction._n,
-            simulation_width=transaction._m,
-            freq=transaction._f,
-            rng=transaction._rng,
+    # What's the transactions basic type? Its code indexes the handlers.
+    return _INDEX_HANDLERS[transaction._transaction_type](transaction, rng)
+
+
+def _get_indices_d_i(
+    transaction: Transaction, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """Return indices for a discrete and instantaneous transaction."""
+    # If instantaneous and discrete it's pretty easy!
+    return transaction.t_0
+
+
+def _get_indices_d_p(
+    transaction: Transaction, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """Return indices for a discrete and periodic transaction."""
+    # If it's periodic and discrete it's still pretty easy.
+    return cfsi._get_indices_periodic(
+        start_index=transaction.t_0,
+        simulation_length=transaction._n,
+        simulation_width=transaction._m,
+        freq=transaction._f,
+    )
+
+
+def _get_indices_d_a(
+    transaction: Transaction, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """Return indices for a discrete and aperiodic transaction."""
+    raise NotImplementedError
+
+
+def _get_indices_p_i(
+    transaction: Transaction, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """Return indices for a probabilistic and instantaneous transaction."""
+    # If instantaneous and probabilistic it's pretty easy!
+    # One draw per parallel simulation, all at the transaction's timestep.
+    dtype = cfsi._get_index_dtype(max(transaction._n, transaction._m))
+    if not 0 <= transaction.t_0 < transaction._n:
+        # An event scheduled outside the simulation never fires, just as
+        #   in `TransactionBank.finalize`.
+        return np.empty((0, 2), dtype=dtype)
+    rng = transaction.rng if rng is None else rng
+    cols = np.flatnonzero(rng.random(transaction._m) < transaction._f).astype(dtype)
+    rows = np.full(cols.shape, transaction.t_0, dtype=dtype)
+    return np.stack([rows, cols], axis=1)
+
+
+def _get_indices_p_p(
+    transaction: Transaction, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """Return indices for a probabilistic and periodic transaction."""
+    # If it's periodic and probabilistic is's still pretty easy.
+    return cfsi._get_indices_periodic(
+        start_index=transaction.t_0,
+        simulation_length=transaction._n,
+        simulation_width=transaction._m,
+        freq=transaction._f,
+        rng=transaction.rng if rng is None else rng,
+    )
+
+
+def _get_indices_p_a(
+    transaction: Transaction, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """Return indices for a probabilistic and aperiodic transaction."""
+    raise NotImplementedError
+
+
+def _get_replicate_rng(
+    seed: Union[int, np.random.SeedSequence], replicate_seed: int
+) -> np.random.Generator:
+    """Return a generator for one replicate of a transaction.
+
+    The transaction seed's spawn key is extended with `_REPLICATE_DOMAIN`
+    and then the replicate seed, so every replicate gets its own
+    independent stream which depends only on the two seeds and never
+    matches a stream `build_batch` hands out.
+
+    Parameters
+    ----------
+    seed: Union[int, np.random.SeedSequence]
+        The transaction's seed.
+    replicate_seed: int
+        The replicate to draw for. Must be a non-negative integer.
+
+    Returns
+    -------
+    rng: np.random.Generator
+    """
+    if (
+        isinstance(replicate_seed, bool)
+        or not isinstance(replicate_seed, (int, np.integer))
+        or replicate_seed < 0
+    ):
+        raise cfserror.InputConfigurationError(
+            """
+        \n[Replicate Seed]: Replicate seeds must be non-negative integers.
+        """
         )
-    elif t_type == "p_a":
-        raise NotImplementedError
+    if isinstance(seed, np.random.SeedSequence):
+        entropy, spawn_key = seed.entropy, tuple(seed.spawn_key)
     else:
-        raise NotImplementedError(f"{t_type} is not a valid transaction type.")
-    return transaction_indices
+        entropy, spawn_key = seed, ()
+    spawn_key += (_REPLICATE_DOMAIN, int(replicate_seed))
+    return default_rng(np.random.SeedSequence(entropy, spawn_key=spawn_key))
+
+
+# Probabilistic types whose presences are drawn on demand.
+_DEFERRED_TYPES = {
+    cftypes.TransactionType.p_i,
+    cftypes.TransactionType.p_p,
+}
+
+# Index handlers, positioned by their cftypes.TransactionType code.
+_INDEX_HANDLERS = (
+    _get_indices_d_i,
+    _get_indices_d_p,
+    _get_indices_d_a,
+    _get_indices_p_i,
+    _get_indices_p_p,
+    _get_indices_p_a,
+)
@@ -35,8 +35,13 @@ A frequency, in the terms of the simulation engine, can be one of a few things:
   probabilistically at regularly scheduled intervals. It is reused.
 * p_a (probabilistic aperiodic): This is a transaction that occurs
   probabilistically at irregularly scheduled intervals. It is reused.
+
+Transaction types are carried as `TransactionType` members, an IntEnum
+whose member names are the tags above, so dispatch compares integers
+and the codes can index handler tables directly.
 """
 from dataclasses import dataclass
+from enum import IntEnum
 from numpy import ndarray
 from typing import Iterable, Union
 
@@ -50,11 +55,16 @@ class TimeStamp:
 
 frequency = Union[int, float, Iterable[Union[int, float]], None]
 
-transaction_types = {
-    "d_i",
-    "d_p",
-    "d_a",
-    "p_i",
-    "p_p",
-    "p_a",
-}
+
+class TransactionType(IntEnum):
+    """Integer codes for the transaction types."""
+
+    d_i = 0
+    d_p = 1
+    d_a = 2
+    p_i = 3
+    p_p = 4
+    p_a = 5
+
+
+transaction_types = {ttype.name for ttype in TransactionType}
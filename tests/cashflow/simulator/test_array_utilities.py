@@ -2,7 +2,7 @@ import pytest
 from src.cashflow.simulate import array_utilities as sau
 
 
-test_cases = [
+is_broadcastable_cases = [
     ((100, 100, 100), (100, 1, 100)),
     ((100, 100, 100), (100, 1)),
     ((100, 100, 100), (100,)),
@@ -10,7 +10,20 @@ test_cases = [
 ]
 
 
-@pytest.mark.parametrize(("shape_1", "shape_2"), test_cases)
+@pytest.mark.parametrize(("shape_1", "shape_2"), is_broadcastable_cases)
 def test_is_broadcastable(shape_1, shape_2):
     """Test is_broadcastable."""
     assert sau.is_broadcastable(shape_1, shape_2)
+
+
+is_not_broadcastable_cases = [
+    ((100, 100, 100), (3,)),
+    ((100, 100, 100), (100, 2, 100)),
+    ((5, 4), (2, 5, 3)),
+]
+
+
+@pytest.mark.parametrize(("shape_1", "shape_2"), is_not_broadcastable_cases)
+def test_is_not_broadcastable(shape_1, shape_2):
+    """Test is_broadcastable rejects incompatible shapes."""
+    assert not sau.is_broadcastable(shape_1, shape_2)
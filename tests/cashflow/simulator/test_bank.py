@@ -0,0 +1,144 @@
+"""Tests for the TransactionBank class."""
+
+import numpy as np
+import pytest
+from src.cashflow.simulate import bank as csb
+from src.cashflow.simulate import transaction as cst
+
+discrete_presence_cases = [
+    (0, None),
+    (3, None),
+    (12, None),
+    (0, 1),
+    (2, 3),
+    (9, 4),
+    (11, 2),
+]
+
+
+@pytest.mark.parametrize(("transaction_time", "frequency"), discrete_presence_cases)
+def test_bank_discrete_presence(transaction_time, frequency):
+    """Test discrete presences match a stand-alone Transaction."""
+    bank = csb.TransactionBank(simulation_length=10, simulation_width=5)
+    bank.add(transaction_time=1, frequency=2)
+    position = bank.add(transaction_time=transaction_time, frequency=frequency)
+    bank.add(transaction_time=0, frequency=0.5)
+    bank.finalize()
+    expected = cst.Transaction(
+        simulation_length=10,
+        simulation_width=5,
+        transaction_time=transaction_time,
+        frequency=frequency,
+        name="expected",
+    )._presence
+    expected = np.atleast_1d(expected)
+    if frequency is None:
+        expected = expected[expected < 10]
+    np.testing.assert_array_equal(bank.presence(position), expected)
+
+
+@pytest.mark.parametrize("prob", [0.0, 0.3, 1.0])
+def test_bank_probabilistic_presence(prob):
+    """Test probabilistic presences are sorted, unique simulations."""
+    bank = csb.TransactionBank(simulation_length=10, simulation_width=50, seed=0)
+    bank.add(transaction_time=1, frequency=2)
+    position = bank.add(transaction_time=4, frequency=prob)
+    bank.finalize()
+    cols = bank.presence(position)
+    assert np.all(np.diff(cols) > 0)
+    assert np.all((cols >= 0) & (cols < 50))
+    if prob == 0.0:
+        assert cols.size == 0
+    if prob == 1.0:
+        assert cols.size == 50
+
+
+def test_bank_names():
+    """Test given names are kept and missing names are filled."""
+    bank = csb.TransactionBank(simulation_length=10, simulation_width=5, seed=0)
+    bank.add(frequency=2, name="rent")
+    bank.add(frequency=3)
+    bank.finalize()
+    assert bank.names[0] == "rent"
+    assert len(bank.names[1]) == 32
+
+
+def test_bank_names_unique():
+    """Test random names identify transactions in a large bank."""
+    bank = csb.TransactionBank(simulation_length=10, simulation_width=5, seed=0)
+    bank.extend(np.zeros(5000, dtype=int), np.full(5000, 2))
+    bank.finalize()
+    assert len(set(bank.names)) == 5000
+
+
+def test_bank_presence_before_finalize():
+    """Test reading presences before finalize raises a clear error."""
+    bank = csb.TransactionBank(simulation_length=10, simulation_width=5)
+    position = bank.add(frequency=2)
+    with pytest.raises(RuntimeError, match="finalize"):
+        bank.presence(position)
+
+
+@pytest.mark.parametrize("period", [0, -1])
+def test_bank_nonpositive_period(period):
+    """Test periods that never advance are rejected by add and extend."""
+    bank = csb.TransactionBank(simulation_length=10, simulation_width=5)
+    # Match the message: src.cashflow and cashflow hold distinct error classes.
+    with pytest.raises(Exception, match="Periodic Transaction Frequency"):
+        bank.add(frequency=period)
+    with pytest.raises(Exception, match="Periodic Transaction Frequency"):
+        bank.extend([0, 0], np.array([2, period]))
+    assert len(bank) == 0
+
+
+def test_bank_unsupported():
+    """Test aperiodic transactions are rejected."""
+    bank = csb.TransactionBank(simulation_length=10, simulation_width=5)
+    with pytest.raises(NotImplementedError):
+        bank.add(frequency=[1, 2])
+
+
+@pytest.mark.parametrize("size", [1, 1000])
+def test_bank_extend(size):
+    """Test extending from arrays matches adding one by one."""
+    rng = np.random.default_rng(0)
+    times = rng.integers(0, 10, size)
+    periods = rng.integers(1, 5, size)
+    probs = rng.random(size)
+    added = csb.TransactionBank(simulation_length=10, simulation_width=5, seed=0)
+    for time, period in zip(times.tolist(), periods.tolist()):
+        added.add(transaction_time=time, frequency=period)
+    for time, prob in zip(times.tolist(), probs.tolist()):
+        added.add(transaction_time=time, frequency=prob)
+    extended = csb.TransactionBank(simulation_length=10, simulation_width=5, seed=0)
+    np.testing.assert_array_equal(extended.extend(times, periods), np.arange(size))
+    extended.extend(times, probs)
+    added.finalize()
+    extended.finalize()
+    for field in ("t0", "freq", "ttype_code", "names"):
+        np.testing.assert_array_equal(getattr(extended, field), getattr(added, field))
+    np.testing.assert_array_equal(extended.presence_indptr, added.presence_indptr)
+    np.testing.assert_array_equal(extended.presence_idx, added.presence_idx)
+
+
+extend_invalid_cases = [
+    ([0, 1], np.array([1])),
+    ([0], np.array([[1]])),
+    ([0], np.array(["a"])),
+    ([0], [None, 1]),
+    ([1.7], np.array([2])),
+    ([1.7], [2]),
+    ([0, 0], [2, -1]),
+    ([0, 1.7], [2, 2]),
+    (np.array([[1]]), np.array([2])),
+]
+
+
+@pytest.mark.parametrize(("times", "frequencies"), extend_invalid_cases)
+def test_bank_extend_invalid(times, frequencies):
+    """Test mismatched or untyped batches are rejected."""
+    bank = csb.TransactionBank(simulation_length=10, simulation_width=5)
+    invalid = (TypeError, ValueError, csb.cfserror.InputConfigurationError)
+    with pytest.raises(invalid):
+        bank.extend(times, frequencies)
+    assert len(bank) == 0
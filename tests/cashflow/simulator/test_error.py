@@ -0,0 +1,11 @@
+import pytest
+from src.cashflow.simulate import error as cse
+
+
+def test_input_configuration_error():
+    """Test the error is an Exception carrying the header and message."""
+    with pytest.raises(Exception) as excinfo:
+        raise cse.InputConfigurationError("bad input")
+    message = str(excinfo.value)
+    assert message.startswith("*" * 79 + "\n[Input Configuration Error]:")
+    assert message.endswith("bad input")
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+from numpy.random import default_rng
+from src.cashflow.simulate import index as csi
+
+periodic_probability_cases = [
+    (10, 5, 0.0),
+    (10, 5, 0.05),
+    (100, 20, 0.3),
+    (100, 20, 0.7),
+    (100, 20, 1.0),
+]
+
+
+@pytest.mark.parametrize(("length", "width", "prob"), periodic_probability_cases)
+def test__get_indices_periodic_probability(length, width, prob):
+    """Test probabilistic indices are unique, sorted, and in bounds."""
+    inds = csi._get_indices_periodic(
+        start_index=0,
+        simulation_length=length,
+        simulation_width=width,
+        freq=prob,
+        rng=default_rng(0),
+    )
+    assert inds.ndim == 2
+    assert inds.shape[1] == 2
+    assert inds.dtype == np.int32
+    flat = inds[:, 0] * width + inds[:, 1]
+    assert np.all(np.diff(flat) > 0)
+    assert np.all((inds >= 0) & (inds < (length, width)))
+    if prob == 0.0:
+        assert inds.shape[0] == 0
+    if prob == 1.0:
+        assert inds.shape[0] == length * width
+
+
+get_indices_dense_cases = [
+    0.7,
+    np.array([[1.0, 0.8, 0.3, 0.1, 0.0]]),
+    np.array([1.0, 0.8, 0.3, 0.1, 0.0]).reshape(-1, 1),
+]
+
+
+@pytest.mark.parametrize("prob", get_indices_dense_cases)
+def test__get_indices_dense(prob):
+    """Test dense indices match argwhere over the same draw."""
+    expected = np.argwhere(default_rng(0).random((5, 5)) < prob)
+    inds = csi._get_indices_dense(
+        simulation_length=5,
+        simulation_width=5,
+        prob=prob,
+        rng=default_rng(0),
+    )
+    np.testing.assert_array_equal(inds, expected)
+
+
+@pytest.mark.parametrize("prob", get_indices_dense_cases)
+def test__get_indices_dense_scratch(prob):
+    """Test dense indices are unchanged when drawn into scratch buffers."""
+    rand_buf = np.empty((5, 5))
+    mask_buf = np.empty((5, 5), dtype=bool)
+    expected = csi._get_indices_dense(5, 5, prob, default_rng(0))
+    inds = csi._get_indices_dense(
+        5, 5, prob, default_rng(0), rand_buf=rand_buf, mask_buf=mask_buf
+    )
+    np.testing.assert_array_equal(inds, expected)
+    np.testing.assert_array_equal(mask_buf, rand_buf < prob)
+
+
+periodic_discrete_cases = [
+    (0, 10, 3, [0, 3, 6, 9]),
+    (2, 10, 1, [2, 3, 4, 5, 6, 7, 8, 9]),
+    (12, 10, 1, []),
+]
+
+
+@pytest.mark.parametrize(
+    ("start", "length", "freq", "expectation"), periodic_discrete_cases
+)
+def test__get_indices_periodic_discrete(start, length, freq, expectation):
+    """Test discrete periodic indices are int32 and correctly spaced."""
+    inds = csi._get_indices_periodic(
+        start_index=start,
+        simulation_length=length,
+        simulation_width=5,
+        freq=freq,
+    )
+    assert inds.dtype == np.int32
+    np.testing.assert_array_equal(inds, expectation)
+
+
+@pytest.mark.parametrize("block_rows", [1, 2, 3, 7])
+def test__get_indices_dense_blocks(block_rows):
+    """Test blockwise dense draws match a single full draw."""
+    prob = np.linspace(0.0, 1.0, 7).reshape(-1, 1)
+    expected = np.argwhere(default_rng(1).random((7, 4)) < prob)
+    inds = csi._get_indices_dense(
+        7, 4, prob, default_rng(1), rand_buf=np.empty((block_rows, 4))
+    )
+    np.testing.assert_array_equal(inds, expected)
+
+
+@pytest.mark.parametrize("prob", [0.01, 0.1, 0.3])
+def test__get_indices_sparse_rate(prob):
+    """Test sparse sampling fires at the requested rate."""
+    inds = csi._get_indices_sparse(1000, 100, prob, default_rng(0))
+    expected = 1000 * 100 * prob
+    assert abs(inds.shape[0] - expected) < 5 * np.sqrt(expected)
+
+
+@pytest.mark.parametrize("prob", [1e-300, 5e-324, float("nan")])
+def test__get_indices_sparse_negligible(prob):
+    """Test negligible or NaN probabilities terminate with no hits."""
+    inds = csi._get_indices_periodic(0, 1000, 1000, prob, rng=default_rng(0))
+    assert inds.shape == (0, 2)
+
+
+@pytest.mark.parametrize("freq", [0.5, np.full((2, 3), 0.5)])
+def test__get_indices_periodic_needs_rng(freq):
+    """Test probabilistic frequencies without an rng raise a clear error."""
+    # Match the message: src.cashflow and cashflow hold distinct error classes.
+    with pytest.raises(Exception, match="No rng object available"):
+        csi._get_indices_periodic(0, 2, 3, freq)
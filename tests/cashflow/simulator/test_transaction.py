@@ -1,38 +1,361 @@
-# """Tests for the Transaction class."""
+"""Tests for the Transaction class."""
+
+import multiprocessing
+import numpy as np
+import pytest
+from src.cashflow import types as cftypes
+from src.cashflow.simulate import transaction as cst
 
-# import pytest
 # from datetime import date
-# from datetime import datetime, timedelta
-# from src.cashflow.simulate import transaction as cst
 # from src.cashflow.types import TimeStamp
 
-# test_cases = [
-#     (None, "d_i"),
-#     (datetime.now(), "d_a"),
-#     (1, "d_p"),
-#     (timedelta(hours=1), "d_p"),
-#     (1.0, "p_p"),
-#     ([1, timedelta(hours=1)], "d_a"),
-#     ([1.0, 1.0], "p_a"),
-# ]
+get_transaction_type_cases = [
+    (None, "d_i"),
+    (1, "d_p"),
+    (True, "d_p"),
+    (1.0, "p_i"),
+    ([1, 1], "d_a"),
+    ([1.0, 1.0], "p_a"),
+    ((1, True), "d_a"),
+    ([1.0, np.float64(1.0)], "p_a"),
+    (np.array([1, 1]), "d_a"),
+    (np.array([1, 1], dtype=np.uint8), "d_a"),
+    (np.array([1.0, 1.0]), "p_a"),
+    (range(3), "d_a"),
+    (np.int64(2), "d_p"),
+    (np.int32(2), "d_p"),
+    (np.uint8(2), "d_p"),
+    (np.float64(0.5), "p_i"),
+    (np.float32(0.5), "p_i"),
+]
 
 
-# @pytest.mark.parametrize(("frequency", "expectation"), test_cases)
-# def test__get_transaction_type(frequency, expectation):
-#     assert cst._get_transaction_type(frequency) == expectation
+@pytest.mark.parametrize(("frequency", "expectation"), get_transaction_type_cases)
+def test__get_transaction_type(frequency, expectation):
+    ttype = cst._get_transaction_type(frequency)
+    assert ttype == cftypes.TransactionType[expectation]
+    assert ttype.name == expectation
 
 
-# test_cases = [
-#     (0, "cfcd208495d565ef66e7dff9f98764da"),
-#     (1, "c4ca4238a0b923820dcc509a6f75849b"),
-#     (2, "c81e728d9d4c2f636f067f89cc14862c"),
-# ]
+get_transaction_type_invalid_cases = [
+    object(),
+    np.array(["a", "b"]),
+    [1, 1.0],
+    "daily",
+]
+
+
+@pytest.mark.parametrize("frequency", get_transaction_type_invalid_cases)
+def test__get_transaction_type_invalid(frequency):
+    with pytest.raises(TypeError):
+        cst._get_transaction_type(frequency)
+
+
+numpy_scalar_frequency_cases = [
+    (np.int64(3), 3),
+    (np.float32(1.0), 10),
+]
+
+
+@pytest.mark.parametrize(("frequency", "n_presences"), numpy_scalar_frequency_cases)
+def test_transaction_numpy_scalar_frequency(frequency, n_presences):
+    """Test NumPy scalar frequencies build presences like Python ones."""
+    t = cst.Transaction(
+        simulation_length=9,
+        simulation_width=10,
+        seed=0,
+        frequency=frequency,
+        name="numpy",
+    )
+    assert len(t.presence()) == n_presences
+
+
+get_timestep_cases = [
+    (0, 0),
+    (7, 7),
+    (np.int32(7), 7),
+    (np.int64(7), 7),
+    (np.uint8(7), 7),
+]
+
+
+@pytest.mark.parametrize(("transaction_time", "expectation"), get_timestep_cases)
+def test__get_timestep(transaction_time, expectation):
+    timestep = cst._get_timestep(transaction_time)
+    assert type(timestep) is int
+    assert timestep == expectation
+
+
+get_timestep_invalid_cases = [
+    7.0,
+    "7",
+    None,
+]
+
+
+@pytest.mark.parametrize("transaction_time", get_timestep_invalid_cases)
+def test__get_timestep_invalid(transaction_time):
+    with pytest.raises(TypeError):
+        cst._get_timestep(transaction_time)
+
+
+@pytest.mark.parametrize("ttype", list(cftypes.TransactionType))
+def test__index_handlers_align(ttype):
+    """Test each transaction type code indexes its own handler."""
+    handler = cst._INDEX_HANDLERS[ttype]
+    assert handler.__name__ == f"_get_indices_{ttype.name}"
+
+
+get_random_name_cases = [
+    (0, "c804ce198ec337e3dc762bdd1a09aece"),
+    (1, "9ea2d098b5f70192f96c06f38d3fbc97"),
+    (2, "fc069c24352798859c017ce862813d3b"),
+    (np.int64(2), "fc069c24352798859c017ce862813d3b"),
+]
+
+
+@pytest.mark.parametrize(("seed", "expectation"), get_random_name_cases)
+def test__get_random_name(seed: int, expectation: str):
+    """Test _get_random_name."""
+    assert cst._get_random_name(seed) == expectation
+
+
+# Pinned digests for seeds at the edges of the fixed width encoding.
+get_random_names_cases = [
+    (-1, "c9af5328349644b9d508d8aced3c4f9f"),
+    (-2, "7db6dcb9142f03dd91487a305f5e8af8"),
+    (2**32, "a8b2f5ace066b0ffd5f2150532e06618"),
+    (123456789, "2875673da32b43dd9bae6a4010c5b3f6"),
+    (-(2**63), "6f3318dc3ac419554feaa8e3047a3e51"),
+    (2**63 - 1, "ec4ef78acb4c7f7832224f8f6f3300dd"),
+]
+
+
+@pytest.mark.parametrize(("seed", "expectation"), get_random_names_cases)
+def test__get_random_names_pinned(seed: int, expectation: str):
+    """Test the scalar and batch name paths against pinned digests."""
+    assert cst._get_random_name(seed) == expectation
+    assert list(cst._get_random_names([seed])) == [expectation]
+
+
+def test__get_random_name_is_cached():
+    """Test repeated seeds are served from the name cache."""
+    cst._get_random_name.cache_clear()
+    first = cst._get_random_name(12345)
+    assert cst._get_random_name(12345) is first
+    assert cst._get_random_name.cache_info().hits == 1
+
+
+def test__get_random_names():
+    """Test the batch name path agrees with the scalar path."""
+    seeds = np.arange(-512, 512)
+    names = cst._get_random_names(seeds)
+    assert names.shape == seeds.shape
+    assert list(names) == [cst._get_random_name(seed) for seed in seeds]
+
+
+rng_is_lazy_cases = [
+    (None, False),
+    (2, False),
+    (0.5, True),
+]
+
+
+@pytest.mark.parametrize(("frequency", "draws"), rng_is_lazy_cases)
+def test_transaction_rng_is_lazy(frequency, draws):
+    """Test the rng is only built when the transaction draws from it."""
+    t = cst.Transaction(
+        simulation_length=10,
+        simulation_width=5,
+        seed=0,
+        frequency=frequency,
+        name="lazy",
+    )
+    assert t._rng is None
+    t.presence()
+    assert (t._rng is not None) == draws
+    assert t.rng is t.rng
+
+
+def test__get_indices_p_i():
+    """Test probabilistic instantaneous indices sit at t_0 in each sim."""
+    t = cst.Transaction(
+        simulation_length=10,
+        simulation_width=1000,
+        transaction_time=3,
+        seed=0,
+        frequency=0.5,
+        name="coin flip",
+    )
+    inds = cst._get_indices(t)
+    assert inds.ndim == 2 and inds.shape[1] == 2
+    assert inds.dtype == np.int32
+    assert np.all(inds[:, 0] == 3)
+    assert np.all(np.diff(inds[:, 1]) > 0)
+    assert 400 < inds.shape[0] < 600
+
+
+@pytest.mark.parametrize("transaction_time", [-1, 10, 2**40])
+def test__get_indices_p_i_outside(transaction_time):
+    """Test p_i transactions outside the simulation never fire."""
+    t = cst.Transaction(
+        simulation_length=10,
+        simulation_width=5,
+        transaction_time=transaction_time,
+        seed=0,
+        frequency=1.0,
+        name="never",
+    )
+    inds = t.presence()
+    assert inds.shape == (0, 2)
+    assert inds.dtype == np.int32
+
+
+presence_is_deferred_cases = [
+    (None, False),
+    (2, False),
+    (0.5, True),
+]
+
+
+@pytest.mark.parametrize(("frequency", "deferred"), presence_is_deferred_cases)
+def test_transaction_presence_is_deferred(frequency, deferred):
+    """Test only probabilistic presences wait for the first request."""
+    t = cst.Transaction(
+        simulation_length=10,
+        simulation_width=5,
+        seed=0,
+        frequency=frequency,
+        name="deferred",
+    )
+    assert (t._presence is None) == deferred
+    assert t.presence() is t.presence()
+
+
+def test_transaction_presence_replicates():
+    """Test replicate draws are reproducible, distinct and uncached."""
+    t = cst.Transaction(
+        simulation_length=10,
+        simulation_width=1000,
+        seed=0,
+        frequency=0.5,
+        name="replicates",
+    )
+    first = t.presence(replicate_seed=1)
+    np.testing.assert_array_equal(first, t.presence(replicate_seed=1))
+    assert not np.array_equal(first, t.presence(replicate_seed=2))
+    assert t._presence is None
+
+
+def test_transaction_presence_replicates_unseeded():
+    """Test unseeded transactions fix their entropy once."""
+    t = cst.Transaction(simulation_length=10, simulation_width=1000, frequency=0.5)
+    np.testing.assert_array_equal(t.presence(3), t.presence(3))
+
+
+def test_transaction_presence_replicates_independent():
+    """Test replicate streams never match the streams build_batch spawns."""
+    kwargs = dict(simulation_length=10, simulation_width=1000, frequency=0.5)
+    replicate = cst.Transaction(seed=0, **kwargs).presence(1)
+    child = cst.build_batch(3, root_seed=0, **kwargs)[1].presence()
+    assert not np.array_equal(replicate, child)
+
+
+@pytest.mark.parametrize("replicate_seed", [-1, 1.5, "1"])
+def test_transaction_presence_replicates_invalid(replicate_seed):
+    """Test malformed replicate seeds raise a configuration error."""
+    t = cst.Transaction(simulation_length=10, simulation_width=5, frequency=0.5)
+    # Match the message: src.cashflow and cashflow hold distinct error classes.
+    with pytest.raises(Exception, match="Replicate Seed"):
+        t.presence(replicate_seed)
+
+
+def test_transaction_presence_replicates_spawned():
+    """Test replicate draws also reproduce for spawned seed sequences."""
+    kwargs = dict(simulation_length=10, simulation_width=1000, frequency=0.5)
+    first, second = (cst.build_batch(1, root_seed=0, **kwargs)[0] for _ in "ab")
+    np.testing.assert_array_equal(first.presence(1), second.presence(1))
+
+
+def test_transaction_unseeded_names_differ():
+    """Test unseeded transactions still get distinct random names."""
+    names = {
+        cst.Transaction(simulation_length=10, simulation_width=5)._name
+        for _ in range(8)
+    }
+    assert len(names) == 8
+
+
+def _put_unseeded_seed(queue) -> None:
+    """Put the seed of an unseeded transaction built in this process."""
+    queue.put(cst.Transaction(simulation_length=10, simulation_width=5)._seed)
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="Forking is not available on this platform.",
+)
+def test_transaction_unseeded_seeds_differ_across_forks():
+    """Test forked workers do not continue the parent's entropy stream."""
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    workers = [
+        context.Process(target=_put_unseeded_seed, args=(queue,)) for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    seeds = [queue.get(timeout=30) for _ in workers]
+    for worker in workers:
+        worker.join()
+    assert len(set(seeds)) == 4
+
+
+def test_transaction_name_is_lazy():
+    """Test random names are made on first access and then kept."""
+    t = cst.Transaction(simulation_length=10, simulation_width=5, seed=3)
+    assert t._name_value is None
+    assert t._name == cst._get_random_name(cst._get_name_seed(3))
+    assert t._name is t._name
+    named = cst.Transaction(simulation_length=10, simulation_width=5, name="rent")
+    assert named._name == "rent"
+
+
+def test_build_batch_factory():
+    """Test factories only receive the child and the given kwargs."""
+    batch = cst.build_batch(
+        2,
+        root_seed=0,
+        factory=lambda child, **kwargs: cst.Transaction(seed=child, **kwargs),
+        simulation_length=10,
+        simulation_width=5,
+    )
+    assert all(t._name_value is None for t in batch)
+    children = np.random.SeedSequence(0).spawn(2)
+    expected = cst._get_random_names([c.generate_state(1)[0] for c in children])
+    assert [t._name for t in batch] == list(expected)
+
+
+def test_transaction_slots():
+    """Test transactions reject attributes outside their slots."""
+    t = cst.Transaction(simulation_length=10, simulation_width=5, seed=0)
+    assert not hasattr(t, "__dict__")
+    with pytest.raises(AttributeError):
+        t._typo = 1
 
 
-# @pytest.mark.parametrize(("seed", "expectation"), test_cases)
-# def test__get_random_name(seed: int, expectation: str):
-#     """Test _get_random_name."""
-#     assert cst._get_random_name(seed) == expectation
+def test_build_batch():
+    """Test batches are reproducible and independently seeded."""
+    kwargs = {"simulation_length": 10, "simulation_width": 5, "frequency": 2}
+    batch = cst.build_batch(4, root_seed=7, **kwargs)
+    again = cst.build_batch(4, root_seed=7, **kwargs)
+    assert [t._name for t in batch] == [t._name for t in again]
+    assert len({t._name for t in batch}) == 4
+    children = np.random.SeedSequence(7).spawn(4)
+    unbatched = [cst.Transaction.from_seed_sequence(c, **kwargs) for c in children]
+    assert [t._name for t in batch] == [t._name for t in unbatched]
+    draws = [t.rng.random() for t in batch]
+    assert draws == [t.rng.random() for t in again]
+    assert len(set(draws)) == 4
 
 
 # test_cases = [